@@ -973,6 +973,8 @@ export const $EventFailure = {
         },
       ],
       title: "Cause",
+      description:
+        "A reduced view of the failure's cause chain. Uses Temporal's JSON (camelCase) field names, keeping the message, source, stack trace and the application, activity, timeout and child workflow failure info. Payloads (details, encoded attributes) are decoded from JSON.",
     },
   },
   type: "object",
@@ -334,6 +334,9 @@ export type ErrorModel = {
 
 export type EventFailure = {
   message: string
+  /**
+   * A reduced view of the failure's cause chain. Uses Temporal's JSON (camelCase) field names, keeping the message, source, stack trace and the application, activity, timeout and child workflow failure info. Payloads (details, encoded attributes) are decoded from JSON.
+   */
   cause?: {
     [key: string]: unknown
   } | null
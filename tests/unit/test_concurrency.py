@@ -2,7 +2,7 @@ import asyncio
 
 import pytest
 
-from tracecat.concurrency import GatheringTaskGroup, apartial
+from tracecat.concurrency import GatheringTaskGroup, SingleFlight, apartial
 
 
 @pytest.mark.anyio
@@ -40,3 +40,29 @@ async def test_apartial():
     partial_coroutine = apartial(mock_coroutine, 1, 2)
     result = await partial_coroutine(3)
     assert result == 6
+
+
+@pytest.mark.anyio
+async def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight[str]()
+    calls: list[str] = []
+
+    def mock_call(value):
+        async def mock_coroutine():
+            calls.append(value)
+            await asyncio.sleep(0.1)
+            return value
+
+        return mock_coroutine
+
+    async with GatheringTaskGroup() as group:
+        for _ in range(5):
+            group.create_task(flight.do("key", mock_call("a")))
+        group.create_task(flight.do("other", mock_call("b")))
+
+    assert calls == ["a", "b"]
+    assert group.results() == ["a", "a", "a", "a", "a", "b"]
+    assert len(flight) == 0
+
+    # Completed calls aren't cached
+    assert await flight.do("key", mock_call("c")) == "c"
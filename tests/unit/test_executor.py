@@ -2,12 +2,14 @@ import asyncio
 import uuid
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from pydantic import SecretStr
 
 from tracecat.dsl.common import create_default_execution_context
 from tracecat.dsl.models import ActionStatement, RunActionInput, RunContext
+from tracecat.executor.client import ExecutorClient
 from tracecat.executor.models import ExecutorActionErrorInfo
 from tracecat.executor.service import run_action_from_input, sync_executor_entrypoint
 from tracecat.expressions.expectations import ExpectedField
@@ -302,3 +304,47 @@ def test_sync_executor_entrypoint_returns_wrapped_error(
     assert result.action_name == "test.error_action"
     assert result.filename == __file__
     assert result.function == "mock_error"
+
+
+@pytest.mark.anyio
+async def test_persistent_executor_clients_share_one_pool():
+    client = ExecutorClient(
+        role=Role(
+            type="service", workspace_id=uuid.uuid4(), service_id="tracecat-runner"
+        ),
+        persistent=True,
+    )
+    other = ExecutorClient(
+        role=Role(
+            type="service", workspace_id=uuid.uuid4(), service_id="tracecat-runner"
+        ),
+        persistent=True,
+    )
+    try:
+        async with client._client() as first:
+            pass
+        async with client._client() as second:
+            pass
+        async with other._client() as other_http:
+            pass
+        assert first is second
+        # Each role keeps its own client (and workspace param) but shares the pool
+        assert other_http is not first
+        assert other_http.params["workspace_id"] != first.params["workspace_id"]
+        transport = ExecutorClient._shared_transport
+        assert transport is not None
+        assert (
+            client._http_client_transport is other._http_client_transport is transport
+        )
+
+        # A pool left over from another event loop is closed and replaced
+        ExecutorClient._shared_transport_loop = None
+        with patch.object(transport, "aclose", wraps=transport.aclose) as aclose:
+            async with client._client() as third:
+                pass
+        aclose.assert_awaited_once()
+        assert third is not first
+        assert ExecutorClient._shared_transport is not transport
+    finally:
+        await ExecutorClient.aclose_shared_transport()
+    assert ExecutorClient._shared_transport is None
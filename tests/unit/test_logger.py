@@ -0,0 +1,58 @@
+import logging
+import queue
+import threading
+
+from tracecat.logger._logger import _NonBlockingQueueHandler
+
+
+def _record(level: int, msg: str) -> logging.LogRecord:
+    return logging.LogRecord("test", level, __file__, 0, msg, None, None)
+
+
+def _drain(log_queue: queue.Queue[logging.LogRecord]) -> list[str]:
+    messages = []
+    while not log_queue.empty():
+        messages.append(log_queue.get_nowait().getMessage())
+    return messages
+
+
+def test_queue_handler_drops_and_reports_records_when_full():
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+    handler = _NonBlockingQueueHandler(log_queue)
+
+    for msg in ("first", "second", "third", "fourth"):
+        handler.handle(_record(logging.INFO, msg))
+    assert handler.dropped == 2
+    assert _drain(log_queue) == ["first", "second"]
+
+    # The drop count is reported after the next record that fits
+    handler.handle(_record(logging.INFO, "fifth"))
+    assert handler.dropped == 0
+    assert _drain(log_queue) == [
+        "fifth",
+        "Dropped 2 log records because the log queue was full",
+    ]
+
+
+def test_queue_handler_waits_for_room_for_errors():
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=1)
+    handler = _NonBlockingQueueHandler(log_queue, error_timeout=5)
+    handler.handle(_record(logging.INFO, "info"))
+
+    # The listener frees up room while the error is waiting for it
+    consumer = threading.Timer(0.05, log_queue.get)
+    consumer.start()
+    handler.handle(_record(logging.ERROR, "error"))
+    consumer.join()
+    assert handler.dropped == 0
+    assert _drain(log_queue) == ["error"]
+
+
+def test_queue_handler_drops_errors_if_the_queue_never_drains():
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=1)
+    handler = _NonBlockingQueueHandler(log_queue, error_timeout=0.01)
+    handler.handle(_record(logging.INFO, "info"))
+
+    handler.handle(_record(logging.ERROR, "error"))
+    assert handler.dropped == 1
+    assert _drain(log_queue) == ["info"]
@@ -122,6 +122,24 @@ def test_udf_validate_args(mock_package):
         udf.validate_args(num="not a number")
 
 
+def test_udf_rebinding_reuses_models(mock_package):
+    """Registering the same function object again should reuse the generated models
+    and not stack validators onto its annotations."""
+    repo = Repository()
+    repo._register_udfs_from_package(mock_package)
+    udf = repo.get("test.test_function")
+    annotations = dict(udf.fn.__annotations__)
+
+    other_repo = Repository()
+    other_repo._register_udf_from_function(udf.fn, name="test_function")
+    other_udf = other_repo.get("test.test_function")
+
+    assert other_udf.args_cls is udf.args_cls
+    assert other_udf.rtype_adapter is udf.rtype_adapter
+    assert udf.fn.__annotations__ == annotations
+    other_udf.validate_args(num="${{ path.to.number }}")
+
+
 def test_registry_function_can_be_called(mock_package):
     """We need to test that the ordering of the workflow tasks is correct."""
     repo = Repository()
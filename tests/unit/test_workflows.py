@@ -10,15 +10,29 @@ Objectives
 
 import asyncio
 import os
+import uuid
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
 from typing import Any, Literal
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 import yaml
 from pydantic import SecretStr
+from temporalio.api.common.v1 import ActivityType, Payload, Payloads
+from temporalio.api.enums.v1 import EventType, RetryState
+from temporalio.api.failure.v1 import (
+    ActivityFailureInfo,
+    ApplicationFailureInfo,
+    Failure,
+)
+from temporalio.api.history.v1 import (
+    HistoryEvent,
+    WorkflowExecutionFailedEventAttributes,
+)
 from temporalio.client import Client, WorkflowFailureError
 from temporalio.common import RetryPolicy
 from temporalio.exceptions import ActivityError, ApplicationError
@@ -30,27 +44,40 @@ from tracecat.concurrency import GatheringTaskGroup
 from tracecat.contexts import ctx_role
 from tracecat.db.engine import get_async_session_context_manager
 from tracecat.db.schemas import Workflow
+from tracecat.dsl._converter import pydantic_data_converter
+from tracecat.dsl.action import (
+    VALIDATION_KEY_MAX_BYTES,
+    DSLActivities,
+    ValidateActionActivityInput,
+    _validation_cache,
+)
 from tracecat.dsl.client import get_temporal_client
 from tracecat.dsl.common import DSLEntrypoint, DSLInput, DSLRunArgs
-from tracecat.dsl.enums import LoopStrategy
+from tracecat.dsl.enums import JoinStrategy, LoopStrategy
 from tracecat.dsl.models import (
+    ActionRetryPolicy,
     ActionStatement,
     DSLConfig,
     ExecutionContext,
     RunActionInput,
+    RunContext,
 )
 from tracecat.dsl.worker import get_activities, new_sandbox_runner
 from tracecat.dsl.workflow import DSLWorkflow, retry_policies
+from tracecat.executor.client import ExecutorClient
 from tracecat.expressions.common import ExprContext
 from tracecat.identifiers.workflow import WorkflowExecutionID, WorkflowID
 from tracecat.logger import logger
+from tracecat.registry.actions.models import RegistryActionValidateResponse
 from tracecat.secrets.models import SecretCreate, SecretKeyValue
 from tracecat.secrets.service import SecretsService
 from tracecat.types.auth import Role
 from tracecat.workflow.executions.models import (
+    EventFailure,
     EventGroup,
     EventHistoryResponse,
     EventHistoryType,
+    _construct_run_action_input,
 )
 from tracecat.workflow.executions.service import WorkflowExecutionsService
 from tracecat.workflow.management.definitions import WorkflowDefinitionsService
@@ -2712,3 +2739,160 @@ async def test_workflow_error_handler_invalid_handler_fail_no_match(
     cause1 = cause0.cause
     assert isinstance(cause1, ApplicationError)
     assert str(cause1) == expected_err_msg
+
+
+def test_construct_run_action_input_roundtrip():
+    """Rebuilding a scheduled activity's input without validation should give
+    the same model the worker serialized."""
+    input = RunActionInput(
+        task=ActionStatement(
+            ref="send_alert",
+            action="core.http_request",
+            args={"url": "https://example.com", "headers": {"b": 1, "a": 2}},
+            depends_on=["a", "b"],
+            retry_policy=ActionRetryPolicy(max_attempts=3, timeout=60),
+            start_delay=1.5,
+            join_strategy=JoinStrategy.ANY,
+        ),
+        exec_context={ExprContext.ACTIONS: {"a": {"result": 1}}},
+        run_context=RunContext(
+            wf_id=TEST_WF_ID,
+            wf_exec_id=generate_test_exec_id("roundtrip"),
+            wf_run_id=uuid.uuid4(),
+            environment="default",
+        ),
+    )
+    (payload,) = pydantic_data_converter.payload_converter.to_payloads([input])
+    constructed = _construct_run_action_input(orjson.loads(payload.data))
+    assert constructed == input
+    assert isinstance(constructed.task.retry_policy, ActionRetryPolicy)
+    assert isinstance(constructed.task.join_strategy, JoinStrategy)
+    assert isinstance(constructed.run_context.wf_run_id, uuid.UUID)
+
+
+def test_event_failure_from_nested_failure():
+    app_failure = Failure(
+        message="Invalid URL",
+        source="PythonSDK",
+        stack_trace="Traceback ...",
+        application_failure_info=ApplicationFailureInfo(
+            type="ExecutorClientError",
+            non_retryable=True,
+            details=Payloads(
+                payloads=[
+                    Payload(
+                        metadata={"encoding": b"json/plain"},
+                        data=orjson.dumps({"ref": "send_alert"}),
+                    ),
+                    Payload(metadata={"encoding": b"binary/null"}),
+                    # Valid JSON, but not encoded as JSON
+                    Payload(metadata={"encoding": b"binary/plain"}, data=b"123"),
+                ]
+            ),
+        ),
+    )
+    activity_failure = Failure(
+        message="Activity task failed",
+        activity_failure_info=ActivityFailureInfo(
+            activity_type=ActivityType(name="run_action_activity"),
+            activity_id="1",
+            retry_state=RetryState.RETRY_STATE_NON_RETRYABLE_FAILURE,
+        ),
+        cause=app_failure,
+    )
+    event = HistoryEvent(
+        event_id=10,
+        event_type=EventType.EVENT_TYPE_WORKFLOW_EXECUTION_FAILED,
+        workflow_execution_failed_event_attributes=WorkflowExecutionFailedEventAttributes(
+            failure=Failure(message="Workflow failed", cause=activity_failure)
+        ),
+    )
+
+    failure = EventFailure.from_history_event(event)
+    assert failure.message == "Workflow failed"
+    assert failure.cause == {
+        "message": "Activity task failed",
+        "activityFailureInfo": {
+            "activityType": {"name": "run_action_activity"},
+            "activityId": "1",
+            "retryState": "RETRY_STATE_NON_RETRYABLE_FAILURE",
+        },
+        "cause": {
+            "message": "Invalid URL",
+            "source": "PythonSDK",
+            "stackTrace": "Traceback ...",
+            "applicationFailureInfo": {
+                "type": "ExecutorClientError",
+                "nonRetryable": True,
+                "details": [{"ref": "send_alert"}, None, "123"],
+            },
+        },
+    }
+
+    # No cause at all
+    event.workflow_execution_failed_event_attributes.failure.ClearField("cause")
+    assert EventFailure.from_history_event(event).cause is None
+
+
+@pytest.mark.anyio
+async def test_validate_action_activity_caches_results():
+    role = Role(type="service", workspace_id=uuid.uuid4(), service_id="tracecat-runner")
+    other_role = Role(
+        type="service", workspace_id=uuid.uuid4(), service_id="tracecat-runner"
+    )
+
+    async def validate(
+        role: Role, args: dict[str, Any]
+    ) -> RegistryActionValidateResponse:
+        task = ActionStatement(ref="a", action="core.transform.reshape", args=args)
+        return await DSLActivities.validate_action_activity(
+            ValidateActionActivityInput(role=role, task=task)
+        )
+
+    ok = RegistryActionValidateResponse(ok=True, message="ok")
+    validate_action = AsyncMock(return_value=ok)
+    _validation_cache.clear()
+    try:
+        with patch.object(ExecutorClient, "validate_action", validate_action):
+            # Key order doesn't matter
+            assert await validate(role, {"x": 1, "y": 2}) == ok
+            assert await validate(role, {"y": 2, "x": 1}) == ok
+            assert validate_action.await_count == 1
+            assert len(_validation_cache) == 1
+
+            # Workspaces don't share results
+            await validate(other_role, {"x": 1, "y": 2})
+            assert validate_action.await_count == 2
+            assert len(_validation_cache) == 2
+
+            # Failed validations aren't cached
+            validate_action.reset_mock()
+            validate_action.return_value = RegistryActionValidateResponse(
+                ok=False, message="bad args"
+            )
+            await validate(role, {"x": "bad"})
+            await validate(role, {"x": "bad"})
+            assert validate_action.await_count == 2
+            assert len(_validation_cache) == 2
+
+            # Oversized args are neither coalesced nor cached
+            validate_action.reset_mock()
+            validate_action.return_value = ok
+            release = asyncio.Event()
+
+            async def slow_validate(**kwargs: Any) -> RegistryActionValidateResponse:
+                await release.wait()
+                return ok
+
+            validate_action.side_effect = slow_validate
+            big_args = {"data": "x" * VALIDATION_KEY_MAX_BYTES}
+            first = asyncio.create_task(validate(role, big_args))
+            second = asyncio.create_task(validate(role, big_args))
+            await asyncio.sleep(0)
+            # Both requests are in flight at once
+            assert validate_action.await_count == 2
+            release.set()
+            assert await first == await second == ok
+            assert len(_validation_cache) == 2
+    finally:
+        _validation_cache.clear()
@@ -1,6 +1,7 @@
-from fastapi import Request, status
+from fastapi import Request, Response, status
 from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
 
 from tracecat import config
 from tracecat.contexts import ctx_role
@@ -67,3 +68,14 @@ async def setup_oss_models():
     )
     await preload_ollama_models(preload_models)
     logger.info("Preloaded models", models=preload_models)
+
+
+def json_response[T](adapter: TypeAdapter[T], value: T) -> Response:
+    """Serialize an already-validated value into a JSON response in one pass.
+
+    Returning a model from a route makes FastAPI validate it against the
+    response model and then encode it again, which is noticeable for large
+    payloads (event histories, workflow graphs, registry schemas). Routes that
+    use this should keep `response_model=` so the OpenAPI schema is unchanged.
+    """
+    return Response(content=adapter.dump_json(value), media_type="application/json")
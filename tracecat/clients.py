@@ -10,6 +10,9 @@ from tracecat.contexts import ctx_role
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import TracecatCredentialsError
 
+# Roles are immutable, so every client can share the same fallback instance
+_DEFAULT_SERVICE_ROLE = Role(type="service", service_id="tracecat-service")
+
 
 class AuthenticatedServiceClient(httpx.AsyncClient):
     """An authenticated service client. Typically used by internal services.
@@ -25,9 +28,7 @@ class AuthenticatedServiceClient(httpx.AsyncClient):
         super().__init__(*args, **kwargs)
         # Precedence: role > ctx_role > default role. Role is always set.
         # NOTE: Actually should we throw if no role?
-        self.role = role or ctx_role.get(
-            Role(type="service", service_id="tracecat-service")
-        )
+        self.role = role or ctx_role.get(_DEFAULT_SERVICE_ROLE)
         try:
             self.headers["x-tracecat-service-key"] = os.environ["TRACECAT__SERVICE_KEY"]
         except KeyError as e:
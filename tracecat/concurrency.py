@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
 from concurrent.futures import Future, ProcessPoolExecutor
 from typing import Any, TypeVar, override
 
@@ -36,6 +36,33 @@ class GatheringTaskGroup[T: Any](asyncio.TaskGroup):
         return [task.result() for task in self.__tasks]
 
 
+class SingleFlight[T: Any]:
+    """Collapse concurrent calls that share a key into a single in-flight call.
+
+    Callers that arrive while a call for the same key is running await its result
+    instead of starting their own. Nothing is cached once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        if (task := self._inflight.get(key)) is None:
+
+            async def run() -> T:
+                return await fn()
+
+            task = asyncio.create_task(run())
+            if not task.done():
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so that one cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 
@@ -31,6 +31,14 @@ TRACECAT__EXECUTOR_CLIENT_TIMEOUT = float(
 
 The `httpx.Client` default is 5s, which doesn't work for long-running actions.
 """
+TRACECAT__EXECUTOR_CLIENT_MAX_CONNECTIONS = int(
+    os.environ.get("TRACECAT__EXECUTOR_CLIENT_MAX_CONNECTIONS", 100)
+)
+"""Maximum open connections per role for the worker's pooled executor clients."""
+TRACECAT__EXECUTOR_CLIENT_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get("TRACECAT__EXECUTOR_CLIENT_MAX_KEEPALIVE_CONNECTIONS", 20)
+)
+"""Maximum idle connections kept alive per role for the pooled executor clients."""
 TRACECAT__DB_NAME = os.environ.get("TRACECAT__DB_NAME")
 TRACECAT__DB_USER = os.environ.get("TRACECAT__DB_USER")
 TRACECAT__DB_PASS = os.environ.get("TRACECAT__DB_PASS")
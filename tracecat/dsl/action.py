@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import random
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
+import orjson
+from cachetools import TTLCache
 from pydantic import BaseModel
 from temporalio import activity
 from temporalio.exceptions import ApplicationError
 
+from tracecat.concurrency import SingleFlight
 from tracecat.contexts import ctx_logger, ctx_run
 from tracecat.dsl.common import context_locator
 from tracecat.dsl.models import ActionErrorInfo, ActionStatement, RunActionInput
@@ -17,6 +23,25 @@ from tracecat.registry.actions.models import RegistryActionValidateResponse
 from tracecat.types.auth import Role
 from tracecat.types.exceptions import ExecutorClientError
 
+TASK_LOG_SAMPLE_RATE = 0.1
+"""Fraction of activity attempts that log the full task at DEBUG level."""
+
+VALIDATION_CACHE_TTL = 300
+"""Seconds to reuse an action validation result for identical requests.
+
+Results only change when the registry is synced, which happens in the API
+and executor rather than in this worker, so the TTL bounds how long a stale
+result can be served after a redeploy.
+"""
+
+VALIDATION_KEY_MAX_BYTES = 32 * 1024
+"""Validation requests with larger serialized args are neither coalesced nor cached."""
+
+_validation_flights: SingleFlight[RegistryActionValidateResponse] = SingleFlight()
+_validation_cache: TTLCache[bytes, RegistryActionValidateResponse] = TTLCache(
+    maxsize=4096, ttl=VALIDATION_CACHE_TTL
+)
+
 
 def contextualize_message(
     task: ActionStatement,
@@ -28,6 +53,51 @@ def contextualize_message(
     return f"[{context_locator(task, loc)}] (Attempt {attempt})\n\n{msg}"
 
 
+def _should_sample(rate: float = TASK_LOG_SAMPLE_RATE) -> bool:
+    return random.random() < rate
+
+
+@lru_cache(maxsize=256)
+def _executor_client(role: Role) -> ExecutorClient:
+    """Get a long-lived executor client for a role.
+
+    All of these share one connection pool, so evicting a client doesn't drop
+    any open connections.
+    """
+    return ExecutorClient(role=role, persistent=True)
+
+
+async def close_executor_clients() -> None:
+    """Close the pooled executor connections. Call this when the worker shuts down."""
+    _executor_client.cache_clear()
+    await ExecutorClient.aclose_shared_transport()
+
+
+def _validation_key(role: Role, action_name: str, args: Any) -> bytes | None:
+    """Digest identifying a validation request, or None if it shouldn't be shared."""
+    try:
+        # Sort keys so that equivalent args produce the same key
+        payload = orjson.dumps(
+            (str(role.workspace_id), action_name, args),
+            option=orjson.OPT_SORT_KEYS,
+        )
+    except TypeError:
+        return None
+    if len(payload) > VALIDATION_KEY_MAX_BYTES:
+        return None
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+_dsl_activities: list[Callable[..., Any]] = []
+"""Activities registered on `DSLActivities`, in definition order."""
+
+
+def _register_activity[F: Callable[..., Any]](fn: F) -> F:
+    """Record a temporal activity so `DSLActivities.load` doesn't have to scan for it."""
+    _dsl_activities.append(fn)
+    return fn
+
+
 class ValidateActionActivityInput(BaseModel):
     role: Role
     task: ActionStatement
@@ -42,16 +112,10 @@ class DSLActivities:
     @classmethod
     def load(cls) -> list[Callable[[RunActionInput], Any]]:
         """Load and return all UDFs in the class."""
-        return [
-            getattr(cls, method_name)
-            for method_name in dir(cls)
-            if hasattr(
-                getattr(cls, method_name),
-                "__temporal_activity_definition",
-            )
-        ]
+        return list(_dsl_activities)
 
     @staticmethod
+    @_register_activity
     @activity.defn
     async def validate_action_activity(
         input: ValidateActionActivityInput,
@@ -61,12 +125,26 @@ class DSLActivities:
         - Validate the action arguments against the UDF spec.
         - Return the validated arguments.
         """
-        client = ExecutorClient(role=input.role)
-        return await client.validate_action(
-            action_name=input.task.action, args=input.task.args
-        )
+        client = _executor_client(input.role)
+        task = input.task
+
+        async def validate() -> RegistryActionValidateResponse:
+            return await client.validate_action(action_name=task.action, args=task.args)
+
+        key = _validation_key(input.role, task.action, task.args)
+        if key is None:
+            return await validate()
+        if (result := _validation_cache.get(key)) is not None:
+            return result
+        # Parallel branches often validate the same task at the same time
+        result = await _validation_flights.do(key, validate)
+        # Failures may be fixed by the next registry sync, so don't hold on to them
+        if result.ok:
+            _validation_cache[key] = result
+        return result
 
     @staticmethod
+    @_register_activity
     @activity.defn
     async def run_action_activity(input: RunActionInput, role: Role) -> Any:
         """Run an action.
@@ -92,10 +170,15 @@ class DSLActivities:
         attempt = act_info.attempt
         act_logger.info(
             "Run action activity",
-            task=task,
             attempt=attempt,
             retry_policy=task.retry_policy,
         )
+        # Only serialize the full task if the record is actually emitted,
+        # and only for a sample of attempts. Error logs are never sampled.
+        if _should_sample():
+            act_logger.opt(lazy=True).debug(
+                "Action task", task=lambda: task.model_dump()
+            )
 
         # Add a delay
         if task.start_delay > 0:
@@ -104,7 +187,7 @@ class DSLActivities:
 
         try:
             # Delegate to the registry client
-            client = ExecutorClient(role=role)
+            client = _executor_client(role)
             return await client.run_action_memory_backend(input)
         except ExecutorClientError as e:
             # We only expect ExecutorClientError to be raised from the executor client
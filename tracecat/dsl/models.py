@@ -32,7 +32,7 @@ class DSLNodeResult(TypedDict, total=False):
     error_typename: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActionErrorInfo:
     """Contains information about an action error."""
 
@@ -207,7 +207,7 @@ class DSLExecutionError(TypedDict, total=False):
     """The message of the exception."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskExceptionInfo:
     exception: Exception
     details: ActionErrorInfo | None = None
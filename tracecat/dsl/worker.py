@@ -9,11 +9,11 @@ from temporalio.worker.workflow_sandbox import (
     SandboxRestrictions,
 )
 
-from tracecat.dsl.action import DSLActivities
+from tracecat.dsl.action import DSLActivities, close_executor_clients
 from tracecat.dsl.client import get_temporal_client
 from tracecat.dsl.validation import validate_trigger_inputs_activity
 from tracecat.dsl.workflow import DSLWorkflow
-from tracecat.logger import logger
+from tracecat.logger import logger, queue_listener
 from tracecat.workflow.management.definitions import (
     get_workflow_definition_activity,
 )
@@ -89,3 +89,8 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         interrupt_event.set()
         loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        # Ctrl+C interrupts main() itself, so clean up here rather than there
+        loop.run_until_complete(close_executor_clients())
+        # Flush any buffered log records before the process exits
+        queue_listener.stop()
@@ -1,5 +1,6 @@
 """Use this in worker to execute actions."""
 
+import asyncio
 from collections.abc import AsyncIterator, Mapping
 from contextlib import asynccontextmanager
 from json import JSONDecodeError
@@ -43,15 +44,72 @@ class ExecutorClient:
     """Use this to interact with the remote executor service."""
 
     _timeout: float = config.TRACECAT__EXECUTOR_CLIENT_TIMEOUT
+    # Connection pool shared by all persistent clients, bound to one event loop
+    _shared_transport: httpx.AsyncHTTPTransport | None = None
+    _shared_transport_loop: asyncio.AbstractEventLoop | None = None
 
-    def __init__(self, role: Role | None = None):
+    def __init__(self, role: Role | None = None, *, persistent: bool = False):
+        """
+        Args:
+            role: The role to make requests as. Defaults to `ctx_role`.
+            persistent: Send requests through a connection pool shared by all
+                persistent clients instead of opening a new one per request.
+                Use this for long-lived clients; call `aclose_shared_transport`
+                on shutdown.
+        """
         self.role = role or ctx_role.get()
         self.logger = logger.bind(service="executor-client", role=self.role)
+        self._persistent = persistent
+        self._http_client: ExecutorHTTPClient | None = None
+        self._http_client_transport: httpx.AsyncHTTPTransport | None = None
+
+    @classmethod
+    async def _get_shared_transport(cls) -> httpx.AsyncHTTPTransport:
+        # Connection pools are bound to the event loop they were created in
+        loop = asyncio.get_running_loop()
+        if cls._shared_transport is None or cls._shared_transport_loop is not loop:
+            await cls.aclose_shared_transport()
+            cls._shared_transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=config.TRACECAT__EXECUTOR_CLIENT_MAX_CONNECTIONS,
+                    max_keepalive_connections=config.TRACECAT__EXECUTOR_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                )
+            )
+            cls._shared_transport_loop = loop
+        return cls._shared_transport
+
+    @classmethod
+    async def aclose_shared_transport(cls) -> None:
+        """Close the connection pool shared by persistent clients, if any."""
+        if (transport := cls._shared_transport) is None:
+            return
+        cls._shared_transport = None
+        cls._shared_transport_loop = None
+        try:
+            await transport.aclose()
+        except Exception as e:
+            # A pool left behind by a closed event loop can't be shut down cleanly
+            logger.warning("Error closing executor transport", error=e)
 
     @asynccontextmanager
     async def _client(self) -> AsyncIterator[ExecutorHTTPClient]:
-        async with ExecutorHTTPClient(self.role) as client:
-            yield client
+        if not self._persistent:
+            async with ExecutorHTTPClient(self.role) as client:
+                yield client
+            return
+        transport = await self._get_shared_transport()
+        if self._http_client is None or self._http_client_transport is not transport:
+            # Don't close the old client, that would close the shared transport.
+            # It holds no connections of its own.
+            self._http_client = ExecutorHTTPClient(
+                self.role,
+                transport=transport,
+                # Requests without their own timeout keep the httpx defaults, but
+                # may wait as long as an action call for a pooled connection
+                timeout=httpx.Timeout(5.0, pool=self._timeout),
+            )
+            self._http_client_transport = transport
+        yield self._http_client
 
     # === Execution ===
 
@@ -127,13 +127,9 @@ async def run_single_action(
             action_secret_names.add(secret.name)
 
     args_secret_refs = set(extract_templated_secrets(args))
-    async with AuthSandbox(
-        secrets=list(action_secret_names | args_secret_refs),
-        target="context",
-        environment=get_runtime_env(),
-        optional_secrets=list(optional_secrets),
-    ) as sandbox:
-        secrets |= sandbox.secrets.copy()
+    secrets |= await _load_secrets(
+        action_secret_names | args_secret_refs, optional_secrets
+    )
 
     context[ExprContext.SECRETS] = context.get(ExprContext.SECRETS, {}) | secrets
     if action.is_template:
@@ -245,13 +241,9 @@ async def run_action_from_input(input: RunActionInput, role: Role) -> Any:
         secret.name for secret in action.secrets or [] if secret.optional
     }
     args_secret_refs = set(extract_templated_secrets(task.args))
-    async with AuthSandbox(
-        secrets=list(action_secret_names | args_secret_refs),
-        target="context",
-        environment=get_runtime_env(),
-        optional_secrets=list(optional_secrets),
-    ) as sandbox:
-        secrets = sandbox.secrets.copy()
+    secrets = await _load_secrets(
+        action_secret_names | args_secret_refs, optional_secrets
+    )
 
     if config.TRACECAT__UNSAFE_DISABLE_SM_MASKING:
         act_logger.warning(
@@ -286,6 +278,21 @@ async def run_action_from_input(input: RunActionInput, role: Role) -> Any:
     return result
 
 
+async def _load_secrets(
+    secret_names: set[str], optional_secrets: set[str]
+) -> dict[str, Any]:
+    """Pull secrets into a context. Most actions need none, so skip the sandbox."""
+    if not secret_names:
+        return {}
+    async with AuthSandbox(
+        secrets=list(secret_names),
+        target="context",
+        environment=get_runtime_env(),
+        optional_secrets=list(optional_secrets),
+    ) as sandbox:
+        return sandbox.secrets.copy()
+
+
 def get_runtime_env() -> str:
     """Get the runtime environment from `ctx_run` contextvar. Defaults to `default` if not set."""
     return getattr(ctx_run.get(), "environment", DEFAULT_SECRETS_ENVIRONMENT)
@@ -72,7 +72,7 @@ VISITOR_NODE_TO_EXPR_TYPE = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class IterableExpr[T]:
     """An expression that represents an iterable collection."""
 
@@ -1,4 +1,4 @@
 from tracecat.logger._default import file_logger, standard_logger
-from tracecat.logger._logger import logger
+from tracecat.logger._logger import logger, queue_listener
 
-__all__ = ["logger", "standard_logger", "file_logger"]
+__all__ = ["logger", "standard_logger", "file_logger", "queue_listener"]
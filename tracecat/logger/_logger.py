@@ -1,16 +1,102 @@
 """Loggers to override default FastAPI uvicorn logger behavior."""
 
+import atexit
+import copy
+import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from loguru import logger as base_logger
 
+LOG_QUEUE_MAXSIZE = 10000
+LOG_QUEUE_ERROR_TIMEOUT = 1.0
+"""Seconds an ERROR record may wait for room in a full log queue before it's dropped."""
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the caller for records below ERROR.
+
+    The caller is usually an event loop, so when the queue is saturated we drop
+    lower-level records instead of blocking on it. Drops are counted and
+    reported once there is room again. Errors wait for room, but only up to
+    `error_timeout`, so a stopped listener can't block the caller forever.
+    """
+
+    def __init__(
+        self,
+        queue: queue.Queue[logging.LogRecord],
+        *,
+        error_timeout: float = LOG_QUEUE_ERROR_TIMEOUT,
+    ) -> None:
+        super().__init__(queue)
+        # QueueHandler only types its queue as put_nowait-able
+        self._log_queue = queue
+        self.error_timeout = error_timeout
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # loguru has already rendered the message (and any traceback), so pass
+        # it through as is instead of formatting the exception a second time.
+        # The stream handler adds its own line terminator.
+        record = copy.copy(record)
+        record.msg = record.getMessage().removesuffix("\n")
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.ERROR:
+                self._log_queue.put(record, timeout=self.error_timeout)
+            else:
+                self._log_queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self.dropped:
+            self._report_dropped()
+
+    def _report_dropped(self) -> None:
+        record = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"Dropped {self.dropped} log records because the log queue was full",
+            args=None,
+            exc_info=None,
+        )
+        try:
+            self._log_queue.put_nowait(record)
+        except queue.Full:
+            return
+        self.dropped = 0
+
+
+class _QueueListener(QueueListener):
+    """Queue listener that can be stopped more than once (e.g. explicitly and at exit)."""
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            super().stop()
+
+
+# Formatting happens in the caller, but the actual stream I/O is owned by a
+# background listener thread so that log calls never block on writes.
+log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+queue_listener = _QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+queue_listener.start()
+atexit.register(queue_listener.stop)
+
 try:
     base_logger.remove(0)
 except ValueError:
     pass
 base_logger.add(
-    sink=sys.stderr,
+    sink=_NonBlockingQueueHandler(log_queue),
     colorize=True,
     level=os.environ.get("LOG_LEVEL", "INFO"),
     format="<fg #808080>{time:YYYY-MM-DD HH:mm:ss.SSSSSS}Z [{process}] |</fg #808080>"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Callable, Mapping
+from functools import cached_property
 from pathlib import Path
 from typing import Annotated, Any, Literal, TypedDict, TypeVar, cast
 
@@ -61,7 +62,7 @@ class BoundRegistryAction(BaseModel):
     # Options
     include_in_schema: bool = True
 
-    @property
+    @cached_property
     def is_async(self) -> bool:
         return inspect.iscoroutinefunction(self.fn)
 
@@ -73,7 +74,12 @@ class BoundRegistryAction(BaseModel):
     def action(self) -> str:
         return f"{self.namespace}.{self.name}"
 
-    def get_interface(self) -> RegistryActionInterface:
+    @cached_property
+    def interface(self) -> RegistryActionInterface:
+        """The action's JSON schema interface.
+
+        Bound actions don't change after they're created, so this is only built once.
+        """
         if self.type == "template":
             if not self.template_action:
                 raise ValueError("Template action is not set")
@@ -118,6 +124,11 @@ class BoundRegistryAction(BaseModel):
         else:
             raise ValueError(f"Invalid registry action type: {self.type}")
 
+    @cached_property
+    def _validate_python(self) -> Callable[..., BaseModel]:
+        """The args model's validator, bound once instead of looked up per call."""
+        return self.args_cls.__pydantic_validator__.validate_python
+
     def validate_args(self, *args, **kwargs) -> dict[str, Any]:
         """Validate the input arguments for a Bound registry action.
 
@@ -138,7 +149,7 @@ class BoundRegistryAction(BaseModel):
             # Note that we're allowing type coercion for the input arguments
             # Use cases would be transforming a UTC string to a datetime object
             # We return the validated input arguments as a dictionary
-            validated = self.args_cls.model_validate(kwargs)
+            validated = self._validate_python(kwargs)
             validated_args = validated.model_dump(mode="json")
             return validated_args
         except ValidationError as e:
@@ -335,7 +346,7 @@ class RegistryActionCreate(RegistryActionBase):
             description=action.description,
             namespace=action.namespace,
             type=action.type,
-            interface=action.get_interface(),
+            interface=action.interface,
             implementation=action.get_implementation(),
             default_title=action.default_title,
             display_group=action.display_group,
@@ -407,7 +418,7 @@ class RegistryActionUpdate(BaseModel):
         return RegistryActionUpdate(
             name=action.name,
             description=action.description,
-            interface=action.get_interface(),
+            interface=action.interface,
             implementation=action.get_implementation(),
             default_title=action.default_title,
             display_group=action.display_group,
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.exc import IntegrityError
 
+from tracecat.api.common import json_response
 from tracecat.auth.credentials import RoleACL
 from tracecat.concurrency import GatheringTaskGroup
 from tracecat.db.dependencies import AsyncDBSession
@@ -17,8 +19,10 @@ from tracecat.types.exceptions import RegistryError
 
 router = APIRouter(prefix=REGISTRY_ACTIONS_PATH, tags=["registry-actions"])
 
+_ACTION_LIST_ADAPTER = TypeAdapter(list[RegistryActionRead])
 
-@router.get("")
+
+@router.get("", response_model=list[RegistryActionRead])
 async def list_registry_actions(
     *,
     role: Role = RoleACL(
@@ -27,7 +31,7 @@ async def list_registry_actions(
         require_workspace="no",
     ),
     session: AsyncDBSession,
-) -> list[RegistryActionRead]:
+) -> Response:
     """List all actions in a registry."""
     service = RegistryActionsService(session, role)
     actions = await service.list_actions()
@@ -35,7 +39,7 @@ async def list_registry_actions(
     async with GatheringTaskGroup[RegistryActionRead]() as tg:
         for action in actions:
             tg.create_task(service.read_action_with_implicit_secrets(action))
-    return tg.results()
+    return json_response(_ACTION_LIST_ADAPTER, tg.results())
 
 
 @router.get(
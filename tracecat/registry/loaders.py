@@ -4,7 +4,7 @@ import importlib
 from collections.abc import Callable
 from typing import Any, NoReturn
 
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel
 from tracecat_registry import RegistrySecret
 
 from tracecat.db.schemas import RegistryAction
@@ -24,6 +24,7 @@ from tracecat.registry.repository import (
     attach_validators,
     generate_model_from_function,
     get_signature_docs,
+    get_type_adapter,
 )
 
 F = Callable[..., Any]
@@ -84,7 +85,7 @@ def get_bound_action_impl(
                 key: schema.description or "-" for key, schema in defn.expects.items()
             },
             rtype_cls=Any,
-            rtype_adapter=TypeAdapter(Any),
+            rtype_adapter=get_type_adapter(Any),
             default_title=action.default_title,
             display_group=action.display_group,
             doc_url=action.doc_url,
@@ -9,6 +9,7 @@ import os
 import re
 import sys
 from collections.abc import Callable
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path
 from timeit import default_timer
@@ -211,7 +212,7 @@ class Repository:
                 key: schema.description or "-" for key, schema in expectation.items()
             },
             rtype=Any,  # type: ignore
-            rtype_adapter=TypeAdapter(Any),
+            rtype_adapter=get_type_adapter(Any),
             default_title=defn.title,
             display_group=defn.display_group,
             include_in_schema=True,
@@ -530,6 +531,10 @@ def import_and_reload(module_name: str) -> ModuleType:
 
 
 def attach_validators(func: F, *validators: Any):
+    # Functions loaded without a module reload are the same objects, so guard
+    # against stacking the validators onto the annotations again.
+    if getattr(func, "__tracecat_validators_attached", False):
+        return
     sig = inspect.signature(func)
 
     new_annotations = {
@@ -539,11 +544,39 @@ def attach_validators(func: F, *validators: Any):
     if sig.return_annotation is not sig.empty:
         new_annotations["return"] = sig.return_annotation
     func.__annotations__ = new_annotations
+    setattr(func, "__tracecat_validators_attached", True)
+
+
+def get_type_adapter(tp: Any) -> TypeAdapter:
+    """Get a type adapter for a type, reusing one if it was already built."""
+    try:
+        return _cached_type_adapter(tp)
+    except TypeError:
+        # Unhashable annotation
+        return TypeAdapter(tp)
+
+
+@lru_cache(maxsize=1024)
+def _cached_type_adapter(tp: Any) -> TypeAdapter:
+    # Bounded, as every registry reload produces new return type objects
+    return TypeAdapter(tp)
 
 
 def generate_model_from_function(
     func: F, udf_kwargs: RegisterKwargs
 ) -> tuple[type[BaseModel], Any, TypeAdapter]:
+    return _generate_model_from_function(func, udf_kwargs.namespace)
+
+
+@lru_cache(maxsize=1024)
+def _generate_model_from_function(
+    func: F, namespace: str
+) -> tuple[type[BaseModel], Any, TypeAdapter]:
+    """Build the args model, return type and return type adapter for a UDF.
+
+    Memoized on the function object, as binding the same UDF (e.g. when loading
+    its implementation for every execution) always produces the same models.
+    """
     # Get the signature of the function
     sig = inspect.signature(func)
     # Create a dictionary to hold field definitions
@@ -563,13 +596,13 @@ def generate_model_from_function(
         fields[name] = (field_type, field_info)
     # Dynamically create and return the Pydantic model class
     input_model = create_model(
-        _udf_slug_camelcase(func, udf_kwargs.namespace),
+        _udf_slug_camelcase(func, namespace),
         __config__=ConfigDict(extra="forbid"),
         **fields,
     )
     # Capture the return type of the function
     rtype = sig.return_annotation if sig.return_annotation is not sig.empty else Any
-    rtype_adapter = TypeAdapter(rtype)
+    rtype_adapter = get_type_adapter(rtype)
 
     return input_model, rtype, rtype_adapter
 
@@ -1,7 +1,7 @@
 from enum import IntEnum
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from tracecat.identifiers import InternalServiceID, UserID, WorkspaceID
 
@@ -40,6 +40,9 @@ class Role(BaseModel):
     - A service's `user_id` is the user it's acting on behalf of. This can be None for internal services.
     """
 
+    # Roles are immutable, which also makes them hashable (usable as cache keys)
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["user", "service"] = Field(frozen=True)
     workspace_id: WorkspaceID | None = Field(default=None, frozen=True)
     user_id: UserID | None = Field(default=None, frozen=True)
@@ -4,12 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
 from typing import Annotated, Any, Generic, Literal, TypedDict, TypeVar, cast
+from uuid import UUID
 
 import orjson
 import temporalio.api.common.v1
 import temporalio.api.enums.v1
+import temporalio.api.failure.v1
 import temporalio.api.history.v1
-from google.protobuf.json_format import MessageToDict
 from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
 from temporalio.client import WorkflowExecution, WorkflowExecutionStatus
 
@@ -18,7 +19,9 @@ from tracecat.dsl.enums import JoinStrategy
 from tracecat.dsl.models import (
     ActionErrorInfo,
     ActionRetryPolicy,
+    ActionStatement,
     RunActionInput,
+    RunContext,
     TriggerInputs,
 )
 from tracecat.identifiers import WorkflowExecutionID, WorkflowID
@@ -104,8 +107,14 @@ class WorkflowExecutionResponse(BaseModel):
 
 
 def destructure_slugified_namespace(s: str, delimiter: str = "__") -> tuple[str, str]:
-    *stem, leaf = s.split(delimiter)
-    return (".".join(stem), leaf)
+    """Split a slugified key into its dotted namespace and leaf name.
+
+    e.g. `core__transform__reshape` -> (`core.transform`, `reshape`)
+    """
+    stem, _, leaf = s.rpartition(delimiter)
+    if delimiter != ".":
+        stem = stem.replace(delimiter, ".")
+    return (stem, leaf)
 
 
 EventInput = TypeVar(
@@ -150,18 +159,16 @@ class EventGroup(BaseModel, Generic[EventInput]):
             != temporalio.api.enums.v1.EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED
         ):
             raise ValueError("Event is not an activity task scheduled event.")
-        # Load the input data
         attrs = event.activity_task_scheduled_event_attributes
-        activity_input_data = orjson.loads(attrs.input.payloads[0].data)
-        # Retry policy
-
         act_type = attrs.activity_type.name
         if act_type in IGNORED_UTILITY_ACTIONS:
             return None
+        # Only decode the input once we know the event is shown in the timeline
+        activity_input_data = orjson.loads(attrs.input.payloads[0].data)
         if act_type == "get_workflow_definition_activity":
             action_input = GetWorkflowDefinitionActivityInputs(**activity_input_data)
         else:
-            action_input = RunActionInput(**activity_input_data)
+            action_input = _construct_run_action_input(activity_input_data)
         if action_input.task is None:
             # It's a utility action.
             return None
@@ -172,7 +179,7 @@ class EventGroup(BaseModel, Generic[EventInput]):
         namespace, task_name = destructure_slugified_namespace(
             task.action, delimiter="."
         )
-        return EventGroup(
+        return EventGroup.model_construct(
             event_id=event.event_id,
             udf_namespace=namespace,
             udf_name=task_name,
@@ -210,7 +217,7 @@ class EventGroup(BaseModel, Generic[EventInput]):
             action_title = None
             action_description = None
 
-        return EventGroup(
+        return EventGroup.model_construct(
             event_id=event.event_id,
             udf_namespace="core.workflow",
             udf_name="execute",
@@ -224,9 +231,39 @@ class EventGroup(BaseModel, Generic[EventInput]):
         )
 
 
+def _construct_run_action_input(data: dict[str, Any]) -> RunActionInput:
+    """Build a `RunActionInput` from a scheduled activity's input without validation.
+
+    The payload was serialized from a validated `RunActionInput` by the worker, so
+    we only restore the nested models and the few non-JSON types.
+    """
+    task = data.get("task")
+    if task is not None:
+        if (retry_policy := task.get("retry_policy")) is not None:
+            task["retry_policy"] = ActionRetryPolicy.model_construct(**retry_policy)
+        if (join_strategy := task.get("join_strategy")) is not None:
+            task["join_strategy"] = JoinStrategy(join_strategy)
+        task = ActionStatement.model_construct(**task)
+    run_context = data["run_context"]
+    run_context["wf_run_id"] = UUID(run_context["wf_run_id"])
+    return RunActionInput.model_construct(
+        task=task,
+        exec_context=data["exec_context"],
+        run_context=RunContext.model_construct(**run_context),
+    )
+
+
 class EventFailure(BaseModel):
     message: str
-    cause: dict[str, Any] | None = None
+    cause: dict[str, Any] | None = Field(
+        default=None,
+        description=(
+            "A reduced view of the failure's cause chain. Uses Temporal's JSON"
+            " (camelCase) field names, keeping the message, source, stack trace"
+            " and the application, activity, timeout and child workflow failure"
+            " info. Payloads (details, encoded attributes) are decoded from JSON."
+        ),
+    )
 
     @staticmethod
     def from_history_event(
@@ -250,12 +287,83 @@ class EventFailure(BaseModel):
         else:
             raise ValueError("Event type not supported for failure extraction.")
 
-        return EventFailure(
+        return EventFailure.model_construct(
             message=failure.message,
-            cause=MessageToDict(failure.cause) if failure.cause is not None else None,
+            cause=_failure_to_dict(failure.cause)
+            if failure.HasField("cause")
+            else None,
         )
 
 
+def _failure_to_dict(failure: temporalio.api.failure.v1.Failure) -> dict[str, Any]:
+    """Extract the failure fields we surface.
+
+    Reads the fields directly instead of walking the whole message with
+    `MessageToDict`. Keys and enum values follow the same (camelCase, enum name)
+    conventions.
+    """
+    result: dict[str, Any] = {"message": failure.message}
+    if failure.source:
+        result["source"] = failure.source
+    if failure.stack_trace:
+        result["stackTrace"] = failure.stack_trace
+    if failure.HasField("encoded_attributes"):
+        result["encodedAttributes"] = _decode_payload(failure.encoded_attributes)
+    match failure.WhichOneof("failure_info"):
+        case "application_failure_info":
+            app_info = failure.application_failure_info
+            result["applicationFailureInfo"] = {
+                "type": app_info.type,
+                "nonRetryable": app_info.non_retryable,
+                "details": [_decode_payload(p) for p in app_info.details.payloads],
+            }
+        case "activity_failure_info":
+            act_info = failure.activity_failure_info
+            result["activityFailureInfo"] = {
+                "activityType": {"name": act_info.activity_type.name},
+                "activityId": act_info.activity_id,
+                "retryState": temporalio.api.enums.v1.RetryState.Name(
+                    act_info.retry_state
+                ),
+            }
+        case "timeout_failure_info":
+            timeout_info = failure.timeout_failure_info
+            result["timeoutFailureInfo"] = {
+                "timeoutType": temporalio.api.enums.v1.TimeoutType.Name(
+                    timeout_info.timeout_type
+                ),
+            }
+        case "child_workflow_execution_failure_info":
+            child_info = failure.child_workflow_execution_failure_info
+            result["childWorkflowExecutionFailureInfo"] = {
+                "namespace": child_info.namespace,
+                "workflowExecution": {
+                    "workflowId": child_info.workflow_execution.workflow_id,
+                    "runId": child_info.workflow_execution.run_id,
+                },
+                "workflowType": {"name": child_info.workflow_type.name},
+                "retryState": temporalio.api.enums.v1.RetryState.Name(
+                    child_info.retry_state
+                ),
+            }
+    if failure.HasField("cause"):
+        result["cause"] = _failure_to_dict(failure.cause)
+    return result
+
+
+def _decode_payload(payload: temporalio.api.common.v1.Payload) -> Any:
+    match payload.metadata.get("encoding"):
+        case b"binary/null":
+            return None
+        case b"json/plain":
+            try:
+                return orjson.loads(payload.data)
+            except orjson.JSONDecodeError:
+                pass
+    # Other encodings (e.g. binary/plain) are surfaced as text
+    return payload.data.decode(errors="replace")
+
+
 class EventHistoryResponse(BaseModel, Generic[EventInput]):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     event_id: int
@@ -4,12 +4,15 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Response,
     status,
 )
+from pydantic import TypeAdapter
 from sqlalchemy.exc import NoResultFound
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from tracecat.api.common import json_response
 from tracecat.auth.dependencies import WorkspaceUserRole
 from tracecat.db.engine import get_async_session
 from tracecat.db.schemas import WorkflowDefinition
@@ -29,6 +32,8 @@ from tracecat.workflow.executions.service import WorkflowExecutionsService
 
 router = APIRouter(prefix="/workflow-executions")
 
+_EVENT_LIST_ADAPTER = TypeAdapter(list[EventHistoryResponse])
+
 
 @router.get("", tags=["workflow-executions"])
 async def list_workflow_executions(
@@ -58,15 +63,19 @@ async def get_workflow_execution(
     return WorkflowExecutionResponse.from_dataclass(execution)
 
 
-@router.get("/{execution_id}/history", tags=["workflow-executions"])
+@router.get(
+    "/{execution_id}/history",
+    tags=["workflow-executions"],
+    response_model=list[EventHistoryResponse],
+)
 async def list_workflow_execution_event_history(
     role: WorkspaceUserRole,
     execution_id: UnquotedExecutionID,
-) -> list[EventHistoryResponse]:
+) -> Response:
     """Get a workflow execution."""
     service = await WorkflowExecutionsService.connect(role=role)
     events = await service.list_workflow_execution_event_history(execution_id)
-    return events
+    return json_response(_EVENT_LIST_ADAPTER, events)
 
 
 @router.post("", tags=["workflow-executions"])
@@ -126,7 +126,7 @@ class WorkflowExecutionsService:
                     group = EventGroup.from_initiated_child_workflow(event)
                     event_group_names[event.event_id] = group
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.START_CHILD_WORKFLOW_EXECUTION_INITIATED,
@@ -140,7 +140,7 @@ class WorkflowExecutionsService:
                     group = event_group_names.get(parent_event_id)
                     event_group_names[event.event_id] = group
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.CHILD_WORKFLOW_EXECUTION_STARTED,
@@ -155,7 +155,7 @@ class WorkflowExecutionsService:
                     initiator_event_id = event.child_workflow_execution_completed_event_attributes.initiated_event_id
                     group = event_group_names.get(initiator_event_id)
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.CHILD_WORKFLOW_EXECUTION_COMPLETED,
@@ -169,7 +169,7 @@ class WorkflowExecutionsService:
                     group = event_group_names.get(gparent_event_id)
                     event_group_names[event.event_id] = group
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.CHILD_WORKFLOW_EXECUTION_FAILED,
@@ -187,7 +187,7 @@ class WorkflowExecutionsService:
                     # Empty strings coerce to None
                     parent_exec_id = attrs.parent_workflow_execution.workflow_id or None
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.WORKFLOW_EXECUTION_STARTED,
@@ -202,7 +202,7 @@ class WorkflowExecutionsService:
                         event.workflow_execution_completed_event_attributes.result
                     )
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.WORKFLOW_EXECUTION_COMPLETED,
@@ -212,7 +212,7 @@ class WorkflowExecutionsService:
                     )
                 case EventType.EVENT_TYPE_WORKFLOW_EXECUTION_FAILED:
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.WORKFLOW_EXECUTION_FAILED,
@@ -222,7 +222,7 @@ class WorkflowExecutionsService:
                     )
                 case EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TERMINATED:
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.WORKFLOW_EXECUTION_TERMINATED,
@@ -231,7 +231,7 @@ class WorkflowExecutionsService:
                     )
                 case EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CANCELED:
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.WORKFLOW_EXECUTION_CANCELED,
@@ -240,7 +240,7 @@ class WorkflowExecutionsService:
                     )
                 case EventType.EVENT_TYPE_WORKFLOW_EXECUTION_CONTINUED_AS_NEW:
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.WORKFLOW_EXECUTION_CONTINUED_AS_NEW,
@@ -249,7 +249,7 @@ class WorkflowExecutionsService:
                     )
                 case EventType.EVENT_TYPE_WORKFLOW_EXECUTION_TIMED_OUT:
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.WORKFLOW_EXECUTION_TIMED_OUT,
@@ -262,7 +262,7 @@ class WorkflowExecutionsService:
                         continue
                     event_group_names[event.event_id] = group
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.ACTIVITY_TASK_SCHEDULED,
@@ -280,7 +280,7 @@ class WorkflowExecutionsService:
                         update={"current_attempt": attrs.attempt}
                     )
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.ACTIVITY_TASK_STARTED,
@@ -298,7 +298,7 @@ class WorkflowExecutionsService:
                         event.activity_task_completed_event_attributes.result
                     )
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.ACTIVITY_TASK_COMPLETED,
@@ -315,7 +315,7 @@ class WorkflowExecutionsService:
                         continue
                     event_group_names[event.event_id] = group
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.ACTIVITY_TASK_FAILED,
@@ -329,7 +329,7 @@ class WorkflowExecutionsService:
                     if not (group := event_group_names.get(gparent_event_id)):
                         continue
                     events.append(
-                        EventHistoryResponse(
+                        EventHistoryResponse.model_construct(
                             event_id=event.event_id,
                             event_time=event.event_time.ToDatetime(datetime.UTC),
                             event_type=EventHistoryType.ACTIVITY_TASK_TIMED_OUT,
@@ -13,11 +13,12 @@ from fastapi import (
     UploadFile,
     status,
 )
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from slugify import slugify
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlmodel import select
 
+from tracecat.api.common import json_response
 from tracecat.auth.dependencies import WorkspaceUserRole
 from tracecat.db.dependencies import AsyncDBSession
 from tracecat.db.schemas import Webhook, Workflow, WorkflowDefinition
@@ -43,6 +44,8 @@ from tracecat.workflow.management.models import (
 
 router = APIRouter(prefix="/workflows")
 
+_WORKFLOW_READ_ADAPTER = TypeAdapter(WorkflowRead)
+
 
 @router.get("", tags=["workflows"])
 async def list_workflows(
@@ -170,12 +173,12 @@ async def create_workflow(
     )
 
 
-@router.get("/{workflow_id}", tags=["workflows"])
+@router.get("/{workflow_id}", tags=["workflows"], response_model=WorkflowRead)
 async def get_workflow(
     role: WorkspaceUserRole,
     session: AsyncDBSession,
     workflow_id: WorkflowID,
-) -> WorkflowRead:
+) -> Response:
     """Return Workflow as title, description, list of Action JSONs, adjacency list of Action IDs."""
     # Get Workflow given workflow_id
     service = WorkflowsManagementService(session, role=role)
@@ -186,11 +189,13 @@ async def get_workflow(
         )
 
     actions = workflow.actions or []
+    # Read straight off the ORM objects rather than dumping each one to a dict first
     actions_responses = {
-        action.id: ActionRead(**action.model_dump()) for action in actions
+        action.id: ActionRead.model_validate(action, from_attributes=True)
+        for action in actions
     }
     # Add webhook/schedules
-    return WorkflowRead(
+    workflow_read = WorkflowRead(
         id=workflow.id,
         owner_id=workflow.owner_id,
         title=workflow.title,
@@ -204,11 +209,12 @@ async def get_workflow(
         static_inputs=workflow.static_inputs,
         config=DSLConfig(**workflow.config),
         actions=actions_responses,
-        webhook=WebhookResponse(**workflow.webhook.model_dump()),
+        webhook=WebhookResponse.model_validate(workflow.webhook, from_attributes=True),
         schedules=workflow.schedules or [],
         alias=workflow.alias,
         error_handler=workflow.error_handler,
     )
+    return json_response(_WORKFLOW_READ_ADAPTER, workflow_read)
 
 
 @router.patch(